@@ -2,7 +2,7 @@
 Calculation model with Observer Pattern support.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from app.operations import OperationStrategy
 
@@ -10,9 +10,21 @@ from app.operations import OperationStrategy
 class CalculationObserver:
     """Observer interface for calculation events."""
     
+    # Observers are only notified of events at or above this level
+    notify_level: int = 0
+    
     def update(self, calculation: 'Calculation') -> None:
         """Called when a calculation is performed."""
         pass  # pragma: no cover
+    
+    def update_batch(self, calculations: List['Calculation']) -> None:
+        """
+        Called once with every calculation performed in a batch.
+        
+        Observers can override this to handle the whole batch at once.
+        """
+        for calculation in calculations:
+            self.update(calculation)
 
 
 class Calculation:
@@ -35,33 +47,46 @@ class Calculation:
         self.strategy = strategy
         self.result: Optional[float] = None
         self.timestamp: Optional[datetime] = None
-        self._observers: List[CalculationObserver] = []
+        # Keyed by id() for O(1) attach/detach; dicts keep insertion order
+        self._observers: Dict[int, CalculationObserver] = {}
     
     def attach_observer(self, observer: CalculationObserver) -> None:
         """Attach an observer to this calculation."""
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.setdefault(id(observer), observer)
     
     def detach_observer(self, observer: CalculationObserver) -> None:
         """Detach an observer from this calculation."""
-        if observer in self._observers: # pragma: no cover
-            self._observers.remove(observer)
+        self._observers.pop(id(observer), None)
     
-    def notify_observers(self) -> None:
-        """Notify all observers about the calculation."""
-        for observer in self._observers:
-            observer.update(self)
+    def get_observers(self) -> List[CalculationObserver]:
+        """Get the attached observers."""
+        return list(self._observers.values())
     
-    def execute(self) -> float:
+    def notify_observers(self, level: int = 0) -> None:
+        """
+        Notify observers about the calculation.
+        
+        Args:
+            level: Event level; observers with a higher notify_level are skipped
+        """
+        for observer in self._observers.values():
+            if observer.notify_level <= level:
+                observer.update(self)
+    
+    def execute(self, notify: bool = True) -> float:
         """
         Execute the calculation and notify ob#servers.
         
+        Args:
+            notify: Whether to notify observers immediately
+        
         Returns:
             Calculation result
         """
         self.result = self.strategy.execute(self.operand1, self.operand2)
         self.timestamp = datetime.now()
-        self.notify_observers()
+        if notify:
+            self.notify_observers()
         return self.result
     
     def to_dict(self) -> dict:
@@ -82,4 +107,56 @@ class Calculation:
     
     def __repr__(self) -> str:
         """Technical representation of the calculation."""
-        return f"Calculation({self.operand1}, {self.operand2}, '{self.operation_name}')" # pragma: no cover
\ No newline at end of file
+        return f"Calculation({self.operand1}, {self.operand2}, '{self.operation_name}')" # pragma: no cover
+
+
+class CalculationBatch:
+    """
+    Context manager that executes calculations and defers observer
+    notification until the batch exits, calling update_batch once per
+    observer instead of update once per calculation.
+    """
+    
+    def __init__(self, level: int = 0):
+        """
+        Initialize a batch.
+        
+        Args:
+            level: Event level used when notifying observers
+        """
+        self.level = level
+        self._calculations: List[Calculation] = []
+    
+    def __enter__(self) -> 'CalculationBatch':
+        """Start collecting calculations."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Notify observers about every calculation executed in the batch."""
+        self.flush()
+    
+    def execute(self, calculation: Calculation) -> float:
+        """
+        Execute a calculation without notifying its observers yet.
+        
+        Args:
+            calculation: Calculation to execute
+            
+        Returns:
+            Calculation result
+        """
+        result = calculation.execute(notify=False)
+        self._calculations.append(calculation)
+        return result
+    
+    def flush(self) -> None:
+        """Notify each observer once with all pending calculations it observes."""
+        pending: Dict[int, Tuple[CalculationObserver, List[Calculation]]] = {}
+        for calculation in self._calculations:
+            for observer in calculation.get_observers():
+                if observer.notify_level <= self.level:
+                    pending.setdefault(id(observer), (observer, []))[1].append(calculation)
+        self._calculations = []
+        
+        for observer, calculations in pending.values():
+            observer.update_batch(calculations)
@@ -3,12 +3,39 @@ Configuration management for the calculator application.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 from app.exceptions import ConfigurationError
 
 
+# Default value for every supported configuration key
+CONFIG_DEFAULTS = {
+    'HISTORY_FILE': 'calculation_history.csv',
+    'AUTO_SAVE': 'true',
+    'MAX_HISTORY': '1000',
+    'DECIMAL_PLACES': '2',
+}
+
+
+@lru_cache(maxsize=None)
+def _load_env_file(env_file: str) -> bool:
+    """
+    Load a .env file into the environment at most once per process.
+    
+    Args:
+        env_file: Path to .env file
+        
+    Returns:
+        True if the file existed and was loaded
+    """
+    if not Path(env_file).exists():
+        return False
+    load_dotenv(env_file, override=True)
+    return True
+
+
 class CalculatorConfig:
     """Manages calculator application configuration."""
     
@@ -29,17 +56,28 @@ class CalculatorConfig:
         Raises:
             ConfigurationError: If configuration is invalid
         """
-        # Load .env file if it exists
-        if Path(self.env_file).exists():
-            load_dotenv(self.env_file, override=True)
+        # Load .env file if it exists (only read from disk once per path)
+        _load_env_file(self.env_file)
         
-        # Load configuration with defaults
-        self.history_file = os.getenv('HISTORY_FILE', 'calculation_history.csv')
-        self.auto_save = os.getenv('AUTO_SAVE', 'true').lower() in ['true', '1', 'yes']
+        # Resolve every key once and cache the raw values
+        self._values: Dict[str, str] = {
+            key: os.getenv(key, default) for key, default in CONFIG_DEFAULTS.items()
+        }
+        self._apply_values()
+    
+    def _apply_values(self) -> None:
+        """
+        Parse cached raw values into typed settings.
+        
+        Raises:
+            ConfigurationError: If configuration is invalid
+        """
+        self.history_file = self._values['HISTORY_FILE']
+        self.auto_save = self._values['AUTO_SAVE'].lower() in ['true', '1', 'yes']
         
         try:
-            self.max_history = int(os.getenv('MAX_HISTORY', '1000'))
-            self.decimal_places = int(os.getenv('DECIMAL_PLACES', '2'))
+            self.max_history = int(self._values['MAX_HISTORY'])
+            self.decimal_places = int(self._values['DECIMAL_PLACES'])
         except ValueError as e: # pragma: no cover
             raise ConfigurationError(f"Invalid configuration value: {e}")
         
@@ -82,9 +120,22 @@ class CalculatorConfig:
         """
         Set a configuration value.
         
+        Only the affected key is updated; the .env file is not re-read.
+        
         Args:
             key: Configuration key
             value: Configuration value
+            
+        Raises:
+            ConfigurationError: If the new configuration is invalid
         """
-        os.environ[key] = value
-        self.load_config()
\ No newline at end of file
+        previous = self._values.get(key)
+        self._values[key] = value
+        try:
+            self._apply_values()
+        except ConfigurationError:
+            # Keep the last valid configuration
+            self._values[key] = previous
+            self._apply_values()
+            raise
+        os.environ[key] = value
\ No newline at end of file
@@ -2,82 +2,102 @@
 Memento Pattern implementation for undo/redo functionality.
 """
 
-from typing import List, Optional
-import copy
+from collections import deque
+from typing import Deque, List, Optional
 from app.calculation import Calculation
 
 
 class CalculatorMemento:
-    """Memento storing calculator state."""
+    """
+    Memento recording a single change to calculator state.
     
-    def __init__(self, calculations: List[Calculation]):
+    Only the appended calculation is stored, not a snapshot of the whole
+    list, so each memento is O(1) regardless of how long the session is.
+    """
+    
+    def __init__(self, calculation: Calculation):
         """
-        Initialize memento with calculator state.
+        Initialize memento with the calculation that was appended.
         
         Args:
-            calculations: List of calculations to save
+            calculation: Calculation added to the calculator state
         """
-        self._calculations = copy.deepcopy(calculations)
+        self._calculation = calculation
+    
+    def get_calculation(self) -> Calculation:
+        """Get the recorded calculation."""
+        return self._calculation
     
-    def get_state(self) -> List[Calculation]:
-        """Get the saved state."""
-        return copy.deepcopy(self._calculations)
+    def apply(self, calculations: List[Calculation]) -> None:
+        """Re-apply the change to a list of calculations."""
+        calculations.append(self._calculation)
+    
+    def revert(self, calculations: List[Calculation]) -> None:
+        """Revert the change on a list of calculations."""
+        calculations.pop()
 
 
 class CalculatorCaretaker:
     """Manages mementos for undo/redo functionality."""
     
-    def __init__(self):
-        """Initialize caretaker."""
-        self._undo_stack: List[CalculatorMemento] = []
-        self._redo_stack: List[CalculatorMemento] = []
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Initialize caretaker.
+        
+        Args:
+            max_history: Maximum number of states kept on each stack;
+                the oldest state is dropped once the limit is reached.
+                None keeps every state.
+        """
+        self._undo_stack: Deque[CalculatorMemento] = deque(maxlen=max_history)
+        self._redo_stack: Deque[CalculatorMemento] = deque(maxlen=max_history)
     
-    def save_state(self, calculations: List[Calculation]) -> None:
+    def record_append(self, calculation: Calculation) -> None:
         """
-        Save current state to undo stack.
+        Record that a calculation was appended to the calculator state.
         
         Args:
-            calculations: Current list of calculations
+            calculation: The appended calculation
         """
-        memento = CalculatorMemento(calculations)
-        self._undo_stack.append(memento)
-        # Clear redo stack when new state is saved
+        self._undo_stack.append(CalculatorMemento(calculation))
+        # Clear redo stack when a new change is recorded
         self._redo_stack.clear()
     
-    def undo(self) -> Optional[List[Calculation]]:
+    def undo(self, calculations: List[Calculation]) -> Optional[Calculation]:
         """
-        Undo last operation.
+        Undo the last change in place.
+        
+        Args:
+            calculations: Live list of calculations to modify
         
         Returns:
-            Previous state or None if undo stack is empty
+            The calculation that was undone or None if undo stack is empty
         """
         if not self._undo_stack:
             return None
         
-        # Save current state to redo stack before undoing
-        current_memento = self._undo_stack.pop()
-        self._redo_stack.append(current_memento)
-        
-        # Return previous state if available
-        if self._undo_stack:
-            return self._undo_stack[-1].get_state()
-        return []
+        memento = self._undo_stack.pop()
+        memento.revert(calculations)
+        self._redo_stack.append(memento)
+        return memento.get_calculation()
     
-    def redo(self) -> Optional[List[Calculation]]:
+    def redo(self, calculations: List[Calculation]) -> Optional[Calculation]:
         """
-        Redo last undone operation.
+        Redo the last undone change in place.
+        
+        Args:
+            calculations: Live list of calculations to modify
         
         Returns:
-            Next state or None if redo stack is empty
+            The calculation that was redone or None if redo stack is empty
         """
         if not self._redo_stack:
             return None
         
-        # Move state from redo stack back to undo stack
         memento = self._redo_stack.pop()
+        memento.apply(calculations)
         self._undo_stack.append(memento)
-        
-        return memento.get_state()
+        return memento.get_calculation()
     
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -91,4 +111,3 @@ class CalculatorCaretaker:
         """Clear both undo and redo stacks."""
         self._undo_stack.clear()
         self._redo_stack.clear()
-        
\ No newline at end of file
@@ -2,8 +2,9 @@
 Calculator REPL with Facade Pattern providing simplified interface.
 """
 
+import atexit
 import sys
-from typing import List
+from typing import Callable, Dict, List
 from app.calculation import Calculation
 from app.operations import OperationFactory
 from app.history import CalculationHistory
@@ -16,34 +17,10 @@ from app.exceptions import (
 )
 
 
-class Calculator:
-    """
-    Facade class providing simplified interface to calculator subsystems.
-    Implements Facade Pattern to hide complexity.
-    """
-    
-    def __init__(self):
-        """Initialize calculator with all subsystems."""
-        try:
-            self.config = CalculatorConfig()
-            self.history = CalculationHistory(self.config.get_history_file())
-            self.caretaker = CalculatorCaretaker()
-            self.validator = InputValidator()
-            self.calculations: List[Calculation] = []
-            self.running = True
-        except ConfigurationError as e: # pragma: no cover
-            print(f"Configuration error: {e}")
-            print("Using default configuration.")
-            self.config = None
-            self.history = CalculationHistory()
-            self.caretaker = CalculatorCaretaker()
-            self.validator = InputValidator()
-            self.calculations = []
-            self.running = True
-    
-    def display_help(self) -> None:
-        """Display help information."""
-        help_text = """
+# Number of unsaved calculations after which auto-save writes the CSV
+AUTO_SAVE_INTERVAL = 32
+
+_HELP_TEXT = """
 ╔══════════════════════════════════════════════════════════════╗
 ║              CALCULATOR HELP MENU                            ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -78,39 +55,101 @@ EXAMPLES:
   > root 16 2
   Result: 4.0
         """
-        print(help_text)
+
+_BANNER = (
+    "╔══════════════════════════════════════════════════════════════╗\n"
+    "║     Welcome to the Advanced Calculator REPL!                ║\n"
+    "╚══════════════════════════════════════════════════════════════╝\n"
+    "Type 'help' for instructions or 'exit' to quit.\n\n"
+)
+
+
+class Calculator:
+    """
+    Facade class providing simplified interface to calculator subsystems.
+    Implements Facade Pattern to hide complexity.
+    """
+    
+    def __init__(self):
+        """Initialize calculator with all subsystems."""
+        try:
+            self.config = CalculatorConfig()
+            self.history = CalculationHistory(self.config.get_history_file())
+            self.caretaker = CalculatorCaretaker(self.config.get_max_history())
+            self.validator = InputValidator()
+            self.calculations: List[Calculation] = []
+            self.running = True
+        except ConfigurationError as e: # pragma: no cover
+            print(f"Configuration error: {e}")
+            print("Using default configuration.")
+            self.config = None
+            self.history = CalculationHistory()
+            self.caretaker = CalculatorCaretaker()
+            self.validator = InputValidator()
+            self.calculations = []
+            self.running = True
+        
+        # Command name -> handler, so dispatch is a single dict lookup
+        self._commands: Dict[str, Callable[[], None]] = {
+            'help': self.display_help,
+            'history': self.display_history,
+            'clear': self._handle_clear,
+            'undo': self.undo_last,
+            'redo': self.redo_last,
+            'save': self._handle_save,
+            'load': self._handle_load,
+            'stats': self.display_stats,
+            'exit': self._handle_exit,
+        }
+    
+    def display_help(self) -> None:
+        """Display help information."""
+        print(_HELP_TEXT)
     
     def display_history(self) -> None:
         """Display calculation history."""
-        if self.history.is_empty():
-            print("No calculations in history yet.")
+        # History is read from CSV on first access, so loading can fail here
+        try:
+            if self.history.is_empty():
+                print("No calculations in history yet.")
+                return
+            df = self.history.get_last_n(20)
+        except HistoryError as e:
+            print(f"Error loading history: {e}")
             return
         
-        print("\n" + "="*60)
-        print("CALCULATION HISTORY")
-        print("="*60)
+        # Collect all lines and write them at once
+        lines = ["\n" + "="*60, "CALCULATION HISTORY", "="*60]
         
-        df = self.history.get_last_n(20)
-        for idx, row in df.iterrows():
-            print(f"{idx + 1}. {row['operand1']} {row['operation']} {row['operand2']} = {row['result']}")
+        rows = df[['operand1', 'operation', 'operand2', 'result']].itertuples(name=None)
+        for idx, operand1, operation, operand2, result in rows:
+            lines.append(f"{idx + 1}. {operand1} {operation} {operand2} = {result}")
         
-        print("="*60 + "\n")
+        lines.append("="*60 + "\n")
+        print("\n".join(lines))
     
     def display_stats(self) -> None:
         """Display history statistics."""
-        stats = self.history.get_statistics()
+        try:
+            stats = self.history.get_statistics()
+        except HistoryError as e:
+            print(f"Error loading history: {e}")
+            return
         
-        print("\n" + "="*60)
-        print("HISTORY STATISTICS")
-        print("="*60)
-        print(f"Total calculations: {stats['total_calculations']}")
+        lines = [
+            "\n" + "="*60,
+            "HISTORY STATISTICS",
+            "="*60,
+            f"Total calculations: {stats['total_calculations']}",
+        ]
         
         if stats['operations']:
-            print("\nOperations breakdown:")
+            lines.append("\nOperations breakdown:")
             for op, count in stats['operations'].items():
-                print(f"  {op}: {count}")
+                lines.append(f"  {op}: {count}")
         
-        print("="*60 + "\n")
+        lines.append("="*60 + "\n")
+        print("\n".join(lines))
     
     def perform_calculation(self, operation: str, num1: float, num2: float) -> None:
         """
@@ -121,24 +160,23 @@ EXAMPLES:
             num1: First operand
             num2: Second operand
         """
-        # Save state before performing calculation
-        self.caretaker.save_state(self.calculations.copy())
-        
-        # Create operation strategy
-        strategy = OperationFactory.create_operation(operation)
+        # Normalize the name once and look up the operation strategy with it
+        name = OperationFactory.normalize_operation_name(operation)
+        strategy = OperationFactory._lookup(name, operation)
         
         # Create calculation and attach history observer
-        calc = Calculation(num1, num2, operation, strategy)
+        calc = Calculation(num1, num2, name, strategy)
         calc.attach_observer(self.history)
         
         # Execute calculation
         result = calc.execute()
         
-        # Add to internal list
+        # Add to internal list and record the change for undo
         self.calculations.append(calc)
+        self.caretaker.record_append(calc)
         
-        # Auto-save if enabled
-        if self.config and self.config.is_auto_save_enabled():
+        # Auto-save if enabled, batching writes every AUTO_SAVE_INTERVAL calculations
+        if self._auto_save_enabled() and self.history.get_unsaved_count() >= AUTO_SAVE_INTERVAL:
             self.history.save_history()
         
         print(f"Result: {result}")
@@ -149,12 +187,8 @@ EXAMPLES:
             print("Nothing to undo.")
             return
         
-        previous_state = self.caretaker.undo()
-        if previous_state is not None:
-            self.calculations = previous_state
-            print("Last calculation undone.")
-        else:
-            print("Cannot undo further.")
+        self.caretaker.undo(self.calculations)
+        print("Last calculation undone.")
     
     def redo_last(self) -> None:
         """Redo the last undone calculation."""
@@ -162,12 +196,51 @@ EXAMPLES:
             print("Nothing to redo.")
             return
         
-        next_state = self.caretaker.redo()
-        if next_state is not None:
-            self.calculations = next_state
-            print("Calculation redone.")
-        else:
-            print("Cannot redo further.")
+        self.caretaker.redo(self.calculations)
+        print("Calculation redone.")
+    
+    def _auto_save_enabled(self) -> bool:
+        """Check if auto-save is enabled."""
+        return bool(self.config and self.config.is_auto_save_enabled())
+    
+    def flush_history(self) -> None:
+        """Save unsaved calculations if auto-save is enabled."""
+        if self._auto_save_enabled() and self.history.is_dirty():
+            try:
+                self.history.save_history()
+            except HistoryError as e: # pragma: no cover
+                print(f"Error saving history: {e}")
+    
+    def _handle_exit(self) -> None:
+        """Stop the REPL loop."""
+        self.flush_history()
+        print("Exiting calculator. Goodbye!")
+        self.running = False
+    
+    def _handle_clear(self) -> None:
+        """Clear history and undo/redo state."""
+        self.history.clear_history()
+        self.caretaker.clear()
+        self.calculations.clear()
+        print("History cleared.")
+    
+    def _handle_save(self) -> None:
+        """Save history to CSV."""
+        try:
+            self.history.save_history()
+            print(f"History saved to {self.config.get_history_file() if self.config else 'calculation_history.csv'}")
+        except HistoryError as e: # pragma: no cover
+            print(f"Error saving history: {e}")
+    
+    def _handle_load(self) -> None:
+        """Reload history from CSV."""
+        # Write calculations still waiting for auto-save so reloading keeps them
+        self.flush_history()
+        try:
+            self.history.load_history()
+            print("History loaded successfully.")
+        except HistoryError as e: # pragma: no cover
+            print(f"Error loading history: {e}")
     
     def process_command(self, user_input: str) -> None:
         """
@@ -182,52 +255,9 @@ EXAMPLES:
             return
         
         # Handle special commands
-        if command == "exit":
-            print("Exiting calculator. Goodbye!")
-            self.running = False
-            return
-        
-        if command == "help":
-            self.display_help()
-            return
-        
-        if command == "history":
-            self.display_history()
-            return
-        
-        if command == "clear":
-            self.history.clear_history()
-            self.caretaker.clear()
-            self.calculations.clear()
-            print("History cleared.")
-            return
-        
-        if command == "undo":
-            self.undo_last()
-            return
-        
-        if command == "redo":
-            self.redo_last()
-            return
-        
-        if command == "save":
-            try:
-                self.history.save_history()
-                print(f"History saved to {self.config.get_history_file() if self.config else 'calculation_history.csv'}")
-            except HistoryError as e: # pragma: no cover
-                print(f"Error saving history: {e}")
-            return
-        
-        if command == "load":
-            try:
-                self.history.load_history()
-                print("History loaded successfully.")
-            except HistoryError as e: # pragma: no cover
-                print(f"Error loading history: {e}")
-            return
-        
-        if command == "stats":
-            self.display_stats()
+        handler = self._commands.get(command)
+        if handler:
+            handler()
             return
         
         # Try to parse as operation
@@ -245,10 +275,11 @@ EXAMPLES:
     
     def run(self) -> None:
         """Run the calculator REPL."""
-        print("╔══════════════════════════════════════════════════════════════╗")
-        print("║     Welcome to the Advanced Calculator REPL!                ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        print("Type 'help' for instructions or 'exit' to quit.\n")
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
+        
+        # Make sure unsaved calculations reach disk even if the process exits abruptly
+        atexit.register(self.flush_history)
         
         while self.running:
             try:
@@ -260,6 +291,9 @@ EXAMPLES:
             except EOFError:  # pragma: no cover
                 print("\nExiting calculator. Goodbye!")
                 break
+        
+        self.flush_history()
+        atexit.unregister(self.flush_history)
 
 
 def calculator(): # pragma: no cover
@@ -2,18 +2,32 @@
 History management using pandas DataFrames with Observer Pattern.
 """
 
+import os
+import time
+import numpy as np
 import pandas as pd
-from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from collections import Counter
+from typing import Any, List, Optional
 from app.calculation import Calculation, CalculationObserver
 from app.exceptions import HistoryError
 
 
+HISTORY_COLUMNS = ['operand1', 'operand2', 'operation', 'result', 'timestamp']
+
+# Initial number of rows allocated for the numeric columns
+_INITIAL_CAPACITY = 64
+
+# Seconds during which an in-sync history skips re-checking the CSV mtime
+_LOAD_CHECK_TTL = 1.0
+
+
 class CalculationHistory(CalculationObserver):
     """
     Manages calculation history using pandas DataFrame.
     Implements Observer Pattern to auto-save calculations.
+    
+    Rows are stored column-wise (numpy arrays for operands, lists for
+    results and strings) and a DataFrame is only built when one is requested.
     """
     
     def __init__(self, csv_file: str = "calculation_history.csv"):
@@ -24,8 +38,87 @@ class CalculationHistory(CalculationObserver):
             csv_file: Path to CSV file for storing history
         """
         self.csv_file = csv_file
-        self.df = pd.DataFrame(columns=['operand1', 'operand2', 'operation', 'result', 'timestamp'])
-        self.load_history()
+        self._reset()
+        # The CSV file is only read the first time history is accessed
+        self._loaded = False
+    
+    def _reset(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        """Discard all rows and allocate empty columns."""
+        self._n = 0
+        self._capacity = capacity
+        self._op1 = np.empty(capacity, dtype=np.float64)
+        self._op2 = np.empty(capacity, dtype=np.float64)
+        # Root and power can return complex numbers, so results stay Python objects
+        self._result: List[Any] = []
+        self._ops: List[Optional[str]] = []
+        self._ts: List[Optional[str]] = []
+        self._df_cache: Optional[pd.DataFrame] = None
+        # Calculations added since the last save or load
+        self._dirty_count = 0
+        # mtime of the CSV file when rows last matched it, and when that was checked
+        self._synced_mtime_ns: Optional[int] = None
+        self._synced_at = 0.0
+    
+    def _grow(self, required: int) -> None:
+        """Grow the numeric columns geometrically to hold required rows."""
+        capacity = self._capacity
+        while capacity < required:
+            capacity *= 2
+        for name in ('_op1', '_op2'):
+            column = np.empty(capacity, dtype=np.float64)
+            column[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, column)
+        self._capacity = capacity
+    
+    def _append_columns(self, op1: np.ndarray, op2: np.ndarray, result: List[Any],
+                        ops: List[Optional[str]], ts: List[Optional[str]]) -> None:
+        """Append several rows given column-wise."""
+        start, end = self._n, self._n + len(ops)
+        if end > self._capacity:
+            self._grow(end)
+        self._op1[start:end] = op1
+        self._op2[start:end] = op2
+        self._result.extend(result)
+        self._ops.extend(ops)
+        self._ts.extend(ts)
+        self._n = end
+        self._df_cache = None
+    
+    def _ensure_loaded(self) -> None:
+        """Load the CSV file on first access, keeping rows added before that."""
+        if self._loaded:
+            return
+        
+        n, dirty_count = self._n, self._dirty_count
+        pending = (self._op1[:n].copy(), self._op2[:n].copy(), self._result, self._ops, self._ts)
+        self._reset()
+        try:
+            self.load_history()
+        finally:
+            # Keep the pending rows even if the file could not be read
+            if n:
+                self._append_columns(*pending)
+            self._dirty_count = dirty_count
+    
+    def _mark_synced(self, mtime_ns: int) -> None:
+        """Record that the rows in memory match the CSV file at mtime_ns."""
+        self._synced_mtime_ns = mtime_ns
+        self._synced_at = time.monotonic()
+    
+    def _is_in_sync(self) -> bool:
+        """Check whether the rows in memory still match the CSV file."""
+        if self._synced_mtime_ns is None or self.is_dirty():
+            return False
+        if time.monotonic() - self._synced_at < _LOAD_CHECK_TTL:
+            return True
+        try:
+            mtime_ns = os.stat(self.csv_file).st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns != self._synced_mtime_ns:
+            return False
+        self._mark_synced(mtime_ns)
+        return True
     
     def update(self, calculation: Calculation) -> None:
         """
@@ -34,17 +127,65 @@ class CalculationHistory(CalculationObserver):
         """
         self.add_calculation(calculation)
     
+    def update_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Observer method called once for a batch of calculations.
+        Adds every calculation to history in a single pass.
+        """
+        self.bulk_add(calculations)
+    
+    def bulk_add(self, calculations: List[Calculation]) -> None:
+        """
+        Add several calculations to history with one columnar append.
+        
+        Args:
+            calculations: Calculations to add, in order
+        """
+        count = len(calculations)
+        self._append_columns(
+            np.fromiter((c.operand1 for c in calculations), dtype=np.float64, count=count),
+            np.fromiter((c.operand2 for c in calculations), dtype=np.float64, count=count),
+            [c.result for c in calculations],
+            [c.operation_name for c in calculations],
+            [c.timestamp.isoformat() if c.timestamp else None for c in calculations],
+        )
+        self._dirty_count += count
+    
     def add_calculation(self, calculation: Calculation) -> None:
         """
         Add a calculation to history.
         """
-        calc_dict = calculation.to_dict()
-        new_row = pd.DataFrame([calc_dict])
+        if self._n == self._capacity:
+            self._grow(self._n + 1)
         
-        if self.df.empty:
-            self.df = new_row
-        else:
-            self.df = pd.concat([self.df, new_row], ignore_index=True)
+        i = self._n
+        self._op1[i] = calculation.operand1
+        self._op2[i] = calculation.operand2
+        self._result.append(calculation.result)
+        self._ops.append(calculation.operation_name)
+        self._ts.append(calculation.timestamp.isoformat() if calculation.timestamp else None)
+        self._n += 1
+        self._df_cache = None
+        self._dirty_count += 1
+    
+    def _build_frame(self, start: int = 0) -> pd.DataFrame:
+        """Build a DataFrame from rows start..end, keeping their positions as index."""
+        end = self._n
+        return pd.DataFrame({
+            'operand1': self._op1[start:end].copy(),
+            'operand2': self._op2[start:end].copy(),
+            'operation': self._ops[start:end],
+            'result': self._result[start:end],
+            'timestamp': self._ts[start:end],
+        }, columns=HISTORY_COLUMNS, index=pd.RangeIndex(start, end))
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """Entire history as a DataFrame, rebuilt only after changes."""
+        self._ensure_loaded()
+        if self._df_cache is None:
+            self._df_cache = self._build_frame()
+        return self._df_cache
     
     def get_history(self) -> pd.DataFrame:
         """
@@ -61,15 +202,17 @@ class CalculationHistory(CalculationObserver):
         
         Args:
             n: Number of calculations to retrieve
-            
+        
         Returns:
             DataFrame with last n calculations
         """
-        return self.df.tail(n)
+        self._ensure_loaded()
+        return self._build_frame(max(self._n - n, 0))
     
     def clear_history(self) -> None:
         """Clear all history."""
-        self.df = pd.DataFrame(columns=['operand1', 'operand2', 'operation', 'result', 'timestamp'])
+        self._reset()
+        self._loaded = True
     
     def save_history(self) -> None:
         """
@@ -78,8 +221,11 @@ class CalculationHistory(CalculationObserver):
         Raises:
             HistoryError: If saving fails
         """
+        self._ensure_loaded()
         try:
-            self.df.to_csv(self.csv_file, index=False)
+            self._build_frame().to_csv(self.csv_file, index=False)
+            self._dirty_count = 0
+            self._mark_synced(os.stat(self.csv_file).st_mtime_ns)
         except Exception as e: # pragma: no cover
             raise HistoryError(f"Failed to save history: {e}")
     
@@ -87,27 +233,58 @@ class CalculationHistory(CalculationObserver):
         """
         Load history from CSV file if it exists.
         
+        The file is not re-read while it is unchanged since the last load
+        or save and there are no unsaved calculations.
+        
         Raises:
             HistoryError: If loading fails
         """
         try:
-            if Path(self.csv_file).exists():
-                self.df = pd.read_csv(self.csv_file)
+            if self._is_in_sync():
+                return
+            
+            try:
+                stat_result = os.stat(self.csv_file)
+            except FileNotFoundError:
+                stat_result = None
+            
+            if stat_result is not None:
+                df = pd.read_csv(self.csv_file)
                 # Ensure all expected columns exist
-                expected_cols = ['operand1', 'operand2', 'operation', 'result', 'timestamp']
-                for col in expected_cols:
-                    if col not in self.df.columns:
-                        self.df[col] = None
+                for col in HISTORY_COLUMNS:
+                    if col not in df.columns:
+                        df[col] = None
+                
+                self._reset(max(len(df), _INITIAL_CAPACITY))
+                self._append_columns(
+                    pd.to_numeric(df['operand1']).to_numpy(dtype=np.float64),
+                    pd.to_numeric(df['operand2']).to_numpy(dtype=np.float64),
+                    df['result'].tolist(),
+                    df['operation'].astype(object).where(df['operation'].notna(), None).tolist(),
+                    df['timestamp'].astype(object).where(df['timestamp'].notna(), None).tolist(),
+                )
+                self._mark_synced(stat_result.st_mtime_ns)
+            self._loaded = True
         except Exception as e: # pragma: no cover
             raise HistoryError(f"Failed to load history: {e}")
     
+    def is_dirty(self) -> bool:
+        """Check if there are calculations that have not been saved."""
+        return self._dirty_count > 0
+    
+    def get_unsaved_count(self) -> int:
+        """Get the number of calculations added since the last save or load."""
+        return self._dirty_count
+    
     def get_count(self) -> int:
         """Get the number of calculations in history."""
-        return len(self.df)
+        self._ensure_loaded()
+        return self._n
     
     def is_empty(self) -> bool:
         """Check if history is empty."""
-        return len(self.df) == 0
+        self._ensure_loaded()
+        return self._n == 0
     
     def get_statistics(self) -> dict:
         """
@@ -116,6 +293,7 @@ class CalculationHistory(CalculationObserver):
         Returns:
             Dictionary with statistics
         """
+        self._ensure_loaded()
         if self.is_empty():
             return {
                 'total_calculations': 0,
@@ -123,8 +301,8 @@ class CalculationHistory(CalculationObserver):
             }
         
         stats = {
-            'total_calculations': len(self.df),
-            'operations': self.df['operation'].value_counts().to_dict()
+            'total_calculations': self._n,
+            'operations': dict(Counter(self._ops).most_common())
         }
         
-        return stats
\ No newline at end of file
+        return stats
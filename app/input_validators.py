@@ -2,10 +2,17 @@
 Input validation utilities for the calculator application.
 """
 
+import re
 from typing import Tuple
 from app.exceptions import InvalidInputError
 
 
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# Matches well-formed "<operation> <num1> <num2>" input in a single pass
+_OPERATION_RE = re.compile(rf'^\s*(\S+)\s+({_NUMBER})\s+({_NUMBER})\s*$')
+
+
 class InputValidator:
     """Validates user input for the calculator."""
     
@@ -23,6 +30,11 @@ class InputValidator:
         Raises:
             InvalidInputError: If input format is invalid
         """
+        # Fast path: well-formed input is parsed by the precompiled regex
+        match = _OPERATION_RE.match(user_input) if user_input else None
+        if match:
+            return match.group(1), float(match.group(2)), float(match.group(3))
+        
         # LBYL: Check if input is empty
         if not user_input or not user_input.strip():
             raise InvalidInputError("Input cannot be empty.")
@@ -59,7 +71,8 @@ class InputValidator:
         Returns:
             Lowercase command string
         """
-        if not user_input or not user_input.strip():
+        if not user_input:
             return ""
         
-        return user_input.strip().lower()
\ No newline at end of file
+        command = user_input.strip()
+        return command.lower() if command else ""
\ No newline at end of file
@@ -4,6 +4,7 @@ Operations module implementing the Strategy Pattern for arithmetic operations.
 
 from abc import ABC, abstractmethod
 import math
+import sys
 from app.exceptions import DivisionByZeroError
 
 
@@ -45,9 +46,11 @@ class DivisionStrategy(OperationStrategy):
     
     def execute(self, a: float, b: float) -> float:
         """Divide a by b."""
-        if b == 0:
+        # EAFP: let the C-level division detect a zero divisor
+        try:
+            return a / b
+        except ZeroDivisionError:
             raise DivisionByZeroError("Cannot divide by zero.")
-        return a / b
 
 
 class PowerStrategy(OperationStrategy):
@@ -63,9 +66,11 @@ class RootStrategy(OperationStrategy):
     
     def execute(self, a: float, b: float) -> float:
         """Calculate the b-th root of a."""
-        if b == 0:
+        try:
+            exponent = 1 / b
+        except ZeroDivisionError:
             raise DivisionByZeroError("Cannot calculate 0th root.")
-        return a ** (1 / b)
+        return a ** exponent
 
 
 class ModulusStrategy(OperationStrategy):
@@ -73,24 +78,45 @@ class ModulusStrategy(OperationStrategy):
     
     def execute(self, a: float, b: float) -> float:
         """Calculate a modulo b."""
-        if b == 0:
+        try:
+            return a % b
+        except ZeroDivisionError:
             raise DivisionByZeroError("Cannot perform modulus by zero.")
-        return a % b
 
 
 class OperationFactory:
     """Factory for creating operation strategies."""
     
+    # Strategies are stateless, so a single shared instance of each is reused
     _strategies = {
-        'add': AdditionStrategy,
-        'subtract': SubtractionStrategy,
-        'multiply': MultiplicationStrategy,
-        'divide': DivisionStrategy,
-        'power': PowerStrategy,
-        'root': RootStrategy,
-        'modulus': ModulusStrategy
+        'add': AdditionStrategy(),
+        'subtract': SubtractionStrategy(),
+        'multiply': MultiplicationStrategy(),
+        'divide': DivisionStrategy(),
+        'power': PowerStrategy(),
+        'root': RootStrategy(),
+        'modulus': ModulusStrategy()
     }
     
+    # Error message suffix listing every supported operation
+    _available_str = ', '.join(_strategies.keys())
+    
+    @staticmethod
+    def normalize_operation_name(operation_name: str) -> str:
+        """
+        Normalize an operation name to its canonical interned form.
+        
+        Interning means every calculation shares one string object per
+        operation, so equality checks and grouping compare by identity.
+        
+        Args:
+            operation_name: Name of the operation in any case
+            
+        Returns:
+            Lowercase interned operation name
+        """
+        return sys.intern(operation_name.lower())
+    
     @classmethod
     def create_operation(cls, operation_name: str) -> OperationStrategy:
         """
@@ -100,20 +126,36 @@ class OperationFactory:
             operation_name: Name of the operation
             
         Returns:
-            OperationStrategy instance
+            Shared OperationStrategy instance
+            
+        Raises:
+            InvalidOperationError: If operation is not supported
+        """
+        return cls._lookup(cls.normalize_operation_name(operation_name), operation_name)
+    
+    @classmethod
+    def _lookup(cls, key: str, operation_name: str) -> OperationStrategy:
+        """
+        Return the shared strategy for an already normalized operation name.
+        
+        Args:
+            key: Name as returned by normalize_operation_name
+            operation_name: Name as given by the caller, used in the error message
+            
+        Returns:
+            Shared OperationStrategy instance
             
         Raises:
             InvalidOperationError: If operation is not supported
         """
         from app.exceptions import InvalidOperationError
         
-        strategy_class = cls._strategies.get(operation_name.lower())
-        if not strategy_class:
-            available = ', '.join(cls._strategies.keys())
+        strategy = cls._strategies.get(key)
+        if strategy is None:
             raise InvalidOperationError(
-                f"Unsupported operation: '{operation_name}'. Available: {available}"
+                f"Unsupported operation: '{operation_name}'. Available: {cls._available_str}"
             )
-        return strategy_class()
+        return strategy
     
     @classmethod
     def get_available_operations(cls) -> list:
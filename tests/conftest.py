@@ -0,0 +1,47 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+from app.input_validators import InputValidator
+from app.operations import (
+    AdditionStrategy,
+    SubtractionStrategy,
+    MultiplicationStrategy,
+    DivisionStrategy,
+    PowerStrategy,
+    RootStrategy,
+    ModulusStrategy
+)
+
+
+@pytest.fixture(scope="session")
+def strategies():
+    """
+    Fixture mapping each strategy class to one shared instance.
+    
+    Sharing across the session is only safe because strategies are
+    stateless: execute depends on its arguments alone.
+    """
+    return {cls: cls() for cls in (
+        AdditionStrategy,
+        SubtractionStrategy,
+        MultiplicationStrategy,
+        DivisionStrategy,
+        PowerStrategy,
+        RootStrategy,
+        ModulusStrategy,
+    )}
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """
+    Fixture to provide one validator shared by the whole session.
+    
+    Guards the sharing with a check that the validator exposes no public
+    data attributes that a test could change.
+    """
+    v = InputValidator()
+    assert not any(not k.startswith('_') and not callable(getattr(v, k)) for k in vars(v))
+    return v
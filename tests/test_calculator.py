@@ -3,157 +3,238 @@ Unit tests for calculator REPL with Facade Pattern.
 """
 
 import pytest
+from contextlib import redirect_stdout
 from io import StringIO
 import sys
+import pandas as pd
+from pathlib import Path
 from app.calculator_repl import Calculator
+from app.history import CalculationHistory
+from app.operations import OperationFactory
 from app.exceptions import CalculatorError
 
 
-@pytest.fixture
-def calculator(tmp_path):
-    """Fixture to provide calculator instance with temp files."""
-    import os
-    # Clear any existing environment variables that might interfere
-    for key in ['HISTORY_FILE', 'AUTO_SAVE', 'MAX_HISTORY', 'DECIMAL_PLACES']:
-        os.environ.pop(key, None)
-    
-    # Set test-specific environment
-    os.environ['HISTORY_FILE'] = str(tmp_path / "test_history.csv")
-    os.environ['MAX_HISTORY'] = '1000'
-    os.environ['DECIMAL_PLACES'] = '2'
-    
+@pytest.fixture(scope="module", autouse=True)
+def calculator_env(tmp_path_factory):
+    """Fixture to set test-specific environment once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Clear any existing environment variables that might interfere
+        for key in ['HISTORY_FILE', 'AUTO_SAVE', 'MAX_HISTORY', 'DECIMAL_PLACES']:
+            mp.delenv(key, raising=False)
+        
+        mp.setenv('HISTORY_FILE', str(tmp_path_factory.mktemp("calculator") / "test_history.csv"))
+        mp.setenv('MAX_HISTORY', '1000')
+        mp.setenv('DECIMAL_PLACES', '2')
+        yield
+
+
+@pytest.fixture(scope="module")
+def calculator(calculator_env):
+    """Fixture to provide a calculator instance shared by the module."""
     calc = Calculator()
-    calc.history.clear_history()  # Ensure clean history
     return calc
 
+
+@pytest.fixture(autouse=True)
+def reset_calculator(calculator):
+    """Fixture to reset the shared calculator between tests."""
+    calculator.history.clear_history()
+    calculator.caretaker.clear()
+    calculator.calculations.clear()
+    calculator.running = True
+    Path(calculator.config.get_history_file()).unlink(missing_ok=True)
+
+
 class TestCalculatorCommands:
     """Test suite for calculator commands."""
     
-    def test_display_help(self, calculator, capsys):
+    def test_display_help(self, calculator):
         """Test help command displays help information."""
-        calculator.display_help()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.display_help()
         
-        assert "CALCULATOR HELP MENU" in captured.out
-        assert "add" in captured.out
-        assert "subtract" in captured.out
-        assert "power" in captured.out
-        assert "root" in captured.out
+        output = buf.getvalue()
+        assert "CALCULATOR HELP MENU" in output
+        assert "add" in output
+        assert "subtract" in output
+        assert "power" in output
+        assert "root" in output
     
-    def test_display_history_empty(self, calculator, capsys):
+    def test_display_history_empty(self, calculator):
         """Test history command when empty."""
-        calculator.display_history()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.display_history()
         
-        assert "No calculations in history" in captured.out
+        assert "No calculations in history" in buf.getvalue()
     
-    def test_display_history_with_calculations(self, calculator, capsys):
+    def test_display_history_with_calculations(self, calculator):
         """Test history command with calculations."""
-        calculator.perform_calculation("add", 5, 3)
-        calculator.display_history()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.display_history()
+        
+        output = buf.getvalue()
+        assert "CALCULATION HISTORY" in output
+        assert "1. 5.0 add 3.0 = 8" in output
+    
+    def test_operation_name_normalized_in_history(self, calculator):
+        """Test mixed-case operation names are recorded in canonical form."""
+        calculator.perform_calculation("ADD", 5, 3)
+        calculator.perform_calculation("add", 1, 2)
+        
+        assert calculator.history.get_statistics()['operations'] == {'add': 2}
+    
+    def test_operation_name_normalized_once(self, calculator, monkeypatch):
+        """Test performing a calculation normalizes the operation name only once."""
+        calls = []
+        normalize = OperationFactory.normalize_operation_name
+        
+        def counting_normalize(name):
+            calls.append(name)
+            return normalize(name)
+        
+        monkeypatch.setattr(OperationFactory, 'normalize_operation_name',
+                            staticmethod(counting_normalize))
+        with redirect_stdout(StringIO()):
+            calculator.perform_calculation("ADD", 5, 3)
         
-        assert "CALCULATION HISTORY" in captured.out
-        assert "5" in captured.out
-        assert "3" in captured.out
+        assert calls == ["ADD"]
     
-    def test_display_stats(self, calculator, capsys):
+    def test_display_stats(self, calculator):
         """Test stats command."""
-        calculator.perform_calculation("add", 5, 3)
-        calculator.perform_calculation("multiply", 4, 2)
-        calculator.display_stats()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.perform_calculation("multiply", 4, 2)
+            calculator.display_stats()
         
-        assert "HISTORY STATISTICS" in captured.out
-        assert "Total calculations: 2" in captured.out
+        output = buf.getvalue()
+        assert "HISTORY STATISTICS" in output
+        assert "Total calculations: 2" in output
 
 
 class TestCalculatorOperations:
     """Test suite for calculator operations."""
     
-    def test_perform_addition(self, calculator, capsys):
-        """Test addition operation."""
-        calculator.perform_calculation("add", 10, 5)
-        captured = capsys.readouterr()
+    @pytest.mark.parametrize("op,a,b,expected", [
+        ("add", 10, 5, "15"),
+        ("subtract", 10, 3, "7"),
+        ("multiply", 6, 7, "42"),
+        ("divide", 20, 4, "5.0"),
+        ("power", 2, 3, "8"),
+        ("root", 16, 2, "4.0"),
+        ("modulus", 10, 3, "1"),
+    ])
+    def test_perform_operation(self, calculator, op, a, b, expected):
+        """Test each arithmetic operation prints its result."""
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation(op, a, b)
         
-        assert "Result: 15" in captured.out
+        assert f"Result: {expected}" in buf.getvalue()
+
+
+class TestCalculatorAutoSave:
+    """Test suite for batched auto-save."""
     
-    def test_perform_subtraction(self, calculator, capsys):
-        """Test subtraction operation."""
-        calculator.perform_calculation("subtract", 10, 3)
-        captured = capsys.readouterr()
+    def test_auto_save_waits_for_interval(self, calculator, monkeypatch):
+        """Test history is only written once enough calculations are unsaved."""
+        monkeypatch.setattr('app.calculator_repl.AUTO_SAVE_INTERVAL', 2)
+        history_file = Path(calculator.config.get_history_file())
         
-        assert "Result: 7" in captured.out
-    
-    def test_perform_multiplication(self, calculator, capsys):
-        """Test multiplication operation."""
-        calculator.perform_calculation("multiply", 6, 7)
-        captured = capsys.readouterr()
+        calculator.perform_calculation("add", 1, 2)
+        assert not history_file.exists()
         
-        assert "Result: 42" in captured.out
+        calculator.perform_calculation("add", 3, 4)
+        assert history_file.exists()
+        assert calculator.history.is_dirty() is False
     
-    def test_perform_division(self, calculator, capsys):
-        """Test division operation."""
-        calculator.perform_calculation("divide", 20, 4)
-        captured = capsys.readouterr()
+    def test_exit_flushes_unsaved_calculations(self, calculator):
+        """Test exit saves calculations that have not been written yet."""
+        calculator.perform_calculation("add", 1, 2)
+        assert calculator.history.is_dirty() is True
         
-        assert "Result: 5.0" in captured.out
-    
-    def test_perform_power(self, calculator, capsys):
-        """Test power operation."""
-        calculator.perform_calculation("power", 2, 3)
-        captured = capsys.readouterr()
+        calculator.process_command("exit")
         
-        assert "Result: 8" in captured.out
+        assert calculator.history.is_dirty() is False
+        assert Path(calculator.config.get_history_file()).exists()
     
-    def test_perform_root(self, calculator, capsys):
-        """Test root operation."""
-        calculator.perform_calculation("root", 16, 2)
-        captured = capsys.readouterr()
+    def test_load_keeps_unsaved_calculations(self, calculator):
+        """Test load does not drop calculations waiting for auto-save."""
+        with redirect_stdout(StringIO()):
+            calculator.perform_calculation("add", 1, 2)
+            calculator.process_command("save")
+            calculator.perform_calculation("add", 3, 4)
+            assert calculator.history.is_dirty() is True
+            
+            calculator.process_command("load")
         
-        assert "Result: 4.0" in captured.out
+        assert calculator.history.get_count() == 2
+        assert list(calculator.history.get_history()['operand1']) == [1.0, 3.0]
+
+
+class TestCalculatorHistoryErrors:
+    """Test suite for history load failures on first access."""
     
-    def test_perform_modulus(self, calculator, capsys):
-        """Test modulus operation."""
-        calculator.perform_calculation("modulus", 10, 3)
-        captured = capsys.readouterr()
+    @pytest.mark.parametrize("cmd", ["history", "stats"])
+    def test_load_failure_is_reported(self, calculator, monkeypatch, cmd):
+        """Test a failed CSV read is reported instead of ending the session."""
+        history_file = calculator.config.get_history_file()
+        calculator.history.save_history()
+        # A fresh history has not read the CSV yet, like one built at startup
+        monkeypatch.setattr(calculator, 'history', CalculationHistory(history_file))
         
-        assert "Result: 1" in captured.out
+        def fail(*args, **kwargs):
+            raise OSError("disk error")
+        
+        monkeypatch.setattr(pd, 'read_csv', fail)
+        with redirect_stdout(StringIO()) as buf:
+            calculator.process_command(cmd)
+        
+        assert "Error loading history" in buf.getvalue()
+        assert calculator.running is True
 
 
 class TestCalculatorUndoRedo:
     """Test suite for undo/redo functionality."""
     
-    def test_undo_calculation(self, calculator, capsys):
+    def test_undo_calculation(self, calculator):
         """Test undo functionality."""
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.undo_last()
+        
+        assert "Last calculation undone" in buf.getvalue()
+    
+    def test_undo_restores_previous_calculations(self, calculator):
+        """Test undo removes only the most recent calculation."""
         calculator.perform_calculation("add", 5, 3)
+        calculator.perform_calculation("multiply", 4, 2)
         calculator.undo_last()
-        captured = capsys.readouterr()
         
-        assert "Last calculation undone" in captured.out
+        assert len(calculator.calculations) == 1
+        assert calculator.calculations[0].operation_name == "add"
     
-    def test_undo_empty(self, calculator, capsys):
+    def test_undo_empty(self, calculator):
         """Test undo with no calculations."""
-        calculator.undo_last()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.undo_last()
         
-        assert "Nothing to undo" in captured.out
+        assert "Nothing to undo" in buf.getvalue()
     
-    def test_redo_calculation(self, calculator, capsys):
+    def test_redo_calculation(self, calculator):
         """Test redo functionality."""
-        calculator.perform_calculation("add", 5, 3)
-        calculator.undo_last()
-        calculator.redo_last()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.undo_last()
+            calculator.redo_last()
         
-        assert "Calculation redone" in captured.out
+        assert "Calculation redone" in buf.getvalue()
     
-    def test_redo_empty(self, calculator, capsys):
+    def test_redo_empty(self, calculator):
         """Test redo with nothing to redo."""
-        calculator.redo_last()
-        captured = capsys.readouterr()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.redo_last()
         
-        assert "Nothing to redo" in captured.out
+        assert "Nothing to redo" in buf.getvalue()
 
 
 class TestCalculatorProcessCommand:
@@ -165,48 +246,40 @@ class TestCalculatorProcessCommand:
         
         assert calculator.running is False
     
-    def test_process_help_command(self, calculator, capsys):
-        """Test help command processing."""
-        calculator.process_command("help")
-        captured = capsys.readouterr()
+    @pytest.mark.parametrize("cmd,expected_substr", [
+        ("help", "CALCULATOR HELP MENU"),
+        ("history", "No calculations"),
+        ("clear", "History cleared"),
+        ("add 5 3", "Result: 8.0"),
+        ("add five three", "Input error"),
+        ("divide 10 0", "Math error"),
+    ])
+    def test_process_command_output(self, calculator, cmd, expected_substr):
+        """Test each command prints its expected message."""
+        with redirect_stdout(StringIO()) as buf:
+            calculator.process_command(cmd)
         
-        assert "CALCULATOR HELP MENU" in captured.out
+        assert expected_substr in buf.getvalue()
     
-    def test_process_history_command(self, calculator, capsys):
-        """Test history command processing."""
-        calculator.process_command("history")
-        captured = capsys.readouterr()
-        
-        assert "No calculations" in captured.out or "CALCULATION HISTORY" in captured.out
-    
-    def test_process_clear_command(self, calculator, capsys):
-        """Test clear command processing."""
-        calculator.perform_calculation("add", 5, 3)
-        calculator.process_command("clear")
-        captured = capsys.readouterr()
+    def test_process_clear_command_after_calculation(self, calculator):
+        """Test clear command empties a non-empty history."""
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.process_command("clear")
         
-        assert "History cleared" in captured.out
+        assert "History cleared" in buf.getvalue()
+        assert calculator.history.is_empty() is True
+        assert calculator.calculations == []
     
-    def test_process_operation_command(self, calculator, capsys):
-        """Test operation command processing."""
-        calculator.process_command("add 5 3")
-        captured = capsys.readouterr()
+    def test_process_complex_result(self, calculator):
+        """Test a root with a complex result is printed and kept in history."""
+        with redirect_stdout(StringIO()) as buf:
+            calculator.process_command("root -8 3")
+            calculator.process_command("history")
         
-        assert "Result: 8.0" in captured.out
-    
-    def test_process_invalid_input(self, calculator, capsys):
-        """Test invalid input handling."""
-        calculator.process_command("add five three")
-        captured = capsys.readouterr()
-        
-        assert "Input error" in captured.out or "Invalid" in captured.out
-    
-    def test_process_division_by_zero(self, calculator, capsys):
-        """Test division by zero handling."""
-        calculator.process_command("divide 10 0")
-        captured = capsys.readouterr()
-        
-        assert "Math error" in captured.out or "divide by zero" in captured.out.lower()
+        output = buf.getvalue()
+        assert "Result: (1.0000000000000002+1.7320508075688772j)" in output
+        assert "1. -8.0 root 3.0 = (1.0000000000000002+1.7320508075688772j)" in output
     
     def test_process_empty_command(self, calculator):
         """Test empty command is ignored."""
@@ -214,24 +287,38 @@ class TestCalculatorProcessCommand:
         # Should not raise error, just return
         assert calculator.running is True
 
+
 class TestCalculatorCommandCoverage:
     """Tests to improve coverage of calculator commands."""
     
-    def test_save_command_success(self, calculator, capsys):
+    def test_save_command_success(self, calculator):
         """Test save command saves history."""
-        calculator.perform_calculation("add", 5, 3)
-        calculator.process_command("save")
-        captured = capsys.readouterr()
-        assert "History saved" in captured.out
+        with redirect_stdout(StringIO()) as buf:
+            calculator.perform_calculation("add", 5, 3)
+            calculator.process_command("save")
+        
+        assert "History saved" in buf.getvalue()
     
-    def test_load_command_success(self, calculator, capsys):
+    def test_load_command_success(self, calculator):
         """Test load command."""
-        calculator.process_command("load")
-        captured = capsys.readouterr()
-        assert "loaded" in captured.out.lower()
+        with redirect_stdout(StringIO()) as buf:
+            calculator.process_command("load")
+        
+        assert "loaded" in buf.getvalue().lower()
     
-    def test_stats_command_execution(self, calculator, capsys):
+    def test_stats_command_execution(self, calculator):
         """Test stats command."""
-        calculator.process_command("stats")
-        captured = capsys.readouterr()
-        assert "STATISTICS" in captured.out or "calculations" in captured.out
\ No newline at end of file
+        with redirect_stdout(StringIO()) as buf:
+            calculator.process_command("stats")
+        
+        assert "STATISTICS" in buf.getvalue() or "calculations" in buf.getvalue()
+    
+    def test_run_prints_banner_and_exits(self, calculator, monkeypatch):
+        """Test run prints the banner and stops on exit."""
+        monkeypatch.setattr('builtins.input', lambda prompt: "exit")
+        with redirect_stdout(StringIO()) as buf:
+            calculator.run()
+        
+        output = buf.getvalue()
+        assert "Welcome to the Advanced Calculator REPL!" in output
+        assert "Goodbye" in output
\ No newline at end of file
@@ -8,46 +8,41 @@ from app.calculation import Calculation
 from app.operations import AdditionStrategy
 
 
+# Strategies are stateless and mementos never mutate calculations, so these are shared
+_STRAT = AdditionStrategy()
+_CALC1 = Calculation(5, 3, "add", _STRAT)
+_CALC2 = Calculation(10, 5, "add", _STRAT)
+_CALC3 = Calculation(7, 2, "add", _STRAT)
+
+
 class TestCalculatorMemento:
     """Test suite for CalculatorMemento class."""
     
     def test_memento_initialization(self):
         """Test memento initialization."""
-        strategy = AdditionStrategy()
-        calc = Calculation(5, 3, "add", strategy)
-        calculations = [calc]
+        memento = CalculatorMemento(_CALC1)
         
-        memento = CalculatorMemento(calculations)
-        
-        assert memento is not None
-    
-    def test_memento_get_state(self):
-        """Test getting state from memento."""
-        strategy = AdditionStrategy()
-        calc = Calculation(5, 3, "add", strategy)
-        calculations = [calc]
-        
-        memento = CalculatorMemento(calculations)
-        state = memento.get_state()
-        
-        assert len(state) == 1
-        assert state[0].operand1 == 5
-        assert state[0].operand2 == 3
+        assert memento.get_calculation() is _CALC1
     
-    def test_memento_deep_copy(self):
-        """Test that memento creates deep copy."""
-        strategy = AdditionStrategy()
-        calc = Calculation(5, 3, "add", strategy)
-        calculations = [calc]
+    def test_memento_apply(self):
+        """Test applying memento appends the calculation."""
+        calculations = []
         
-        memento = CalculatorMemento(calculations)
-        state = memento.get_state()
+        memento = CalculatorMemento(_CALC1)
+        memento.apply(calculations)
         
-        # Modify original
-        calculations[0].operand1 = 100
+        assert len(calculations) == 1
+        assert calculations[0].operand1 == 5
+        assert calculations[0].operand2 == 3
+    
+    def test_memento_revert(self):
+        """Test reverting memento removes the calculation."""
+        calculations = [_CALC1]
+        
+        memento = CalculatorMemento(_CALC1)
+        memento.revert(calculations)
         
-        # State should be unchanged
-        assert state[0].operand1 == 5
+        assert calculations == []
 
 
 class TestCalculatorCaretaker:
@@ -60,89 +55,84 @@ class TestCalculatorCaretaker:
         assert caretaker.can_undo() is False
         assert caretaker.can_redo() is False
     
-    def test_save_state(self):
-        """Test saving state."""
+    def test_caretaker_max_history(self):
+        """Test oldest changes are dropped once max_history is reached."""
+        caretaker = CalculatorCaretaker(max_history=2)
+        calculations = []
+        
+        for i in range(3):
+            calc = Calculation(i, 1, "add", _STRAT)
+            calculations.append(calc)
+            caretaker.record_append(calc)
+        
+        assert caretaker.undo(calculations).operand1 == 2
+        assert caretaker.undo(calculations).operand1 == 1
+        assert caretaker.undo(calculations) is None
+        assert len(calculations) == 1
+    
+    def test_record_append(self):
+        """Test recording an appended calculation."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        calc = Calculation(5, 3, "add", strategy)
-        calculations = [calc]
         
-        caretaker.save_state(calculations)
+        caretaker.record_append(_CALC1)
         
         assert caretaker.can_undo() is True
     
     def test_undo_single_state(self):
-        """Test undo with single state."""
+        """Test undo removes the last calculation."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        
-        calc1 = Calculation(5, 3, "add", strategy)
-        calculations1 = [calc1]
-        caretaker.save_state(calculations1)
+        calculations = [_CALC1, _CALC2]
+        caretaker.record_append(_CALC1)
+        caretaker.record_append(_CALC2)
         
-        calc2 = Calculation(10, 5, "add", strategy)
-        calculations2 = [calc1, calc2]
-        caretaker.save_state(calculations2)
+        undone = caretaker.undo(calculations)
         
-        previous_state = caretaker.undo()
-        
-        assert len(previous_state) == 1
-        assert previous_state[0].operand1 == 5
+        assert undone is _CALC2
+        assert len(calculations) == 1
+        assert calculations[0].operand1 == 5
     
     def test_undo_empty_stack(self):
         """Test undo with empty stack."""
         caretaker = CalculatorCaretaker()
         
-        result = caretaker.undo()
+        result = caretaker.undo([])
         
         assert result is None
     
     def test_redo_after_undo(self):
         """Test redo after undo."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        
-        calc1 = Calculation(5, 3, "add", strategy)
-        calculations1 = [calc1]
-        caretaker.save_state(calculations1)
+        calculations = [_CALC1, _CALC2]
+        caretaker.record_append(_CALC1)
+        caretaker.record_append(_CALC2)
         
-        calc2 = Calculation(10, 5, "add", strategy)
-        calculations2 = [calc1, calc2]
-        caretaker.save_state(calculations2)
+        caretaker.undo(calculations)
+        redone = caretaker.redo(calculations)
         
-        caretaker.undo()
-        next_state = caretaker.redo()
-        
-        assert len(next_state) == 2
+        assert redone is _CALC2
+        assert calculations == [_CALC1, _CALC2]
     
     def test_redo_empty_stack(self):
         """Test redo with empty stack."""
         caretaker = CalculatorCaretaker()
         
-        result = caretaker.redo()
+        result = caretaker.redo([])
         
         assert result is None
     
-    def test_redo_cleared_after_new_save(self):
-        """Test redo stack is cleared after new save."""
+    def test_redo_cleared_after_new_record(self):
+        """Test redo stack is cleared after a new change is recorded."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        
-        calc1 = Calculation(5, 3, "add", strategy)
-        calculations1 = [calc1]
-        caretaker.save_state(calculations1)
+        calculations = [_CALC1, _CALC2]
+        caretaker.record_append(_CALC1)
+        caretaker.record_append(_CALC2)
         
-        calc2 = Calculation(10, 5, "add", strategy)
-        calculations2 = [calc1, calc2]
-        caretaker.save_state(calculations2)
-        
-        caretaker.undo()
+        caretaker.undo(calculations)
         assert caretaker.can_redo() is True
         
-        # Save new state
-        calc3 = Calculation(7, 2, "add", strategy)
-        calculations3 = [calc1, calc3]
-        caretaker.save_state(calculations3)
+        # Record new change
+        calculations.append(_CALC3)
+        caretaker.record_append(_CALC3)
         
         assert caretaker.can_redo() is False
     
@@ -152,36 +142,28 @@ class TestCalculatorCaretaker:
         
         assert caretaker.can_undo() is False
         
-        strategy = AdditionStrategy()
-        calc = Calculation(5, 3, "add", strategy)
-        caretaker.save_state([calc])
+        caretaker.record_append(_CALC1)
         
         assert caretaker.can_undo() is True
     
     def test_can_redo(self):
         """Test can_redo method."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        
-        calc = Calculation(5, 3, "add", strategy)
-        caretaker.save_state([calc])
+        caretaker.record_append(_CALC1)
         
         assert caretaker.can_redo() is False
         
-        caretaker.undo()
+        caretaker.undo([_CALC1])
         
         assert caretaker.can_redo() is True
     
     def test_clear(self):
         """Test clearing caretaker stacks."""
         caretaker = CalculatorCaretaker()
-        strategy = AdditionStrategy()
-        
-        calc = Calculation(5, 3, "add", strategy)
-        caretaker.save_state([calc])
-        caretaker.undo()
+        caretaker.record_append(_CALC1)
+        caretaker.undo([_CALC1])
         
         caretaker.clear()
         
         assert caretaker.can_undo() is False
-        assert caretaker.can_redo() is False
\ No newline at end of file
+        assert caretaker.can_redo() is False
@@ -4,42 +4,64 @@ Unit tests for configuration management.
 
 import pytest
 import os
+import re
 from pathlib import Path
-from app.calculator_config import CalculatorConfig
+from app.calculator_config import CONFIG_DEFAULTS, CalculatorConfig
 from app.exceptions import ConfigurationError
 
 
+_MAX_HIST_RE = re.compile("MAX_HISTORY must be at least 1")
+_DECIMAL_PLACES_RE = re.compile("DECIMAL_PLACES must be non-negative")
+
+
+@pytest.fixture(scope="module")
+def env_dir(tmp_path_factory):
+    """Fixture to provide one temporary directory for the module's .env files."""
+    return tmp_path_factory.mktemp("config")
+
+
 @pytest.fixture
-def temp_env_file(tmp_path):
+def temp_env_file(env_dir, request):
     """Fixture to provide temporary .env file."""
-    env_file = tmp_path / ".env"
-    return str(env_file)
+    # Unique per test: .env files are only read once per path
+    return str(env_dir / f"{request.node.name}.env")
 
 
 @pytest.fixture
-def create_env_file(temp_env_file):
+def isolated_env(monkeypatch):
+    """Fixture to give each test its own environment without config variables."""
+    # load_dotenv and set_config write os.environ directly. Setting each key
+    # before deleting it makes monkeypatch restore it at teardown even when
+    # it was originally unset, so those writes do not leak between tests.
+    for key in CONFIG_DEFAULTS:
+        monkeypatch.setenv(key, '')
+        monkeypatch.delenv(key)
+
+
+@pytest.fixture
+def create_env_file(temp_env_file, isolated_env):
     """Fixture to create .env file with content."""
-    import os
     def _create(content):
-        # Clear environment variables before test
-        for key in ['HISTORY_FILE', 'AUTO_SAVE', 'MAX_HISTORY', 'DECIMAL_PLACES']:
-            os.environ.pop(key, None)
-        
         with open(temp_env_file, 'w') as f:
             f.write(content)
         return temp_env_file
     return _create
 
 
+@pytest.fixture
+def set_env(isolated_env, monkeypatch):
+    """Fixture to set configuration through environment variables."""
+    def _set(mapping: dict):
+        for key, value in mapping.items():
+            monkeypatch.setenv(key, value)
+    return _set
+
+
 class TestCalculatorConfig:
     """Test suite for CalculatorConfig class."""
     
-    def test_config_initialization_default(self, temp_env_file):
+    def test_config_initialization_default(self, isolated_env, temp_env_file):
         """Test config initialization with defaults."""
-        import os
-        # Clear the env var to test true defaults
-        os.environ.pop('HISTORY_FILE', None)
-        
         config = CalculatorConfig(env_file=temp_env_file)
         
         assert config.get_history_file() == 'calculation_history.csv'
@@ -63,64 +85,56 @@ DECIMAL_PLACES=4
         assert config.get_max_history() == 500
         assert config.get_decimal_places() == 4
     
-    def test_config_auto_save_true_variations(self, create_env_file):
+    def test_config_auto_save_true_variations(self, set_env, temp_env_file):
         """Test auto_save accepts various true values."""
-        env_content = "AUTO_SAVE=TRUE"
-        env_file = create_env_file(env_content)
-        config = CalculatorConfig(env_file=env_file)
+        set_env({'AUTO_SAVE': 'TRUE'})
+        config = CalculatorConfig(env_file=temp_env_file)
         
         assert config.is_auto_save_enabled() is True
     
-    def test_config_auto_save_false(self, create_env_file):
+    def test_config_auto_save_false(self, set_env, temp_env_file):
         """Test auto_save false value."""
-        env_content = "AUTO_SAVE=false"
-        env_file = create_env_file(env_content)
-        config = CalculatorConfig(env_file=env_file)
+        set_env({'AUTO_SAVE': 'false'})
+        config = CalculatorConfig(env_file=temp_env_file)
         
         assert config.is_auto_save_enabled() is False
     
-    def test_config_invalid_max_history(self, create_env_file):
-        """Test validation rejects invalid max_history."""
-        env_content = "MAX_HISTORY=0"
-        env_file = create_env_file(env_content)
+    @pytest.mark.parametrize("key,value,match", [
+        ('MAX_HISTORY', '0', _MAX_HIST_RE),
+        ('MAX_HISTORY', '-10', _MAX_HIST_RE),
+        ('DECIMAL_PLACES', '-1', _DECIMAL_PLACES_RE),
+    ])
+    def test_config_invalid_value(self, set_env, temp_env_file, key, value, match):
+        """Test validation rejects out-of-range values."""
+        set_env({key: value})
         
-        with pytest.raises(ConfigurationError, match="MAX_HISTORY must be at least 1"):
-            CalculatorConfig(env_file=env_file)
+        with pytest.raises(ConfigurationError, match=match):
+            CalculatorConfig(env_file=temp_env_file)
     
-    def test_config_negative_max_history(self, create_env_file):
-        """Test validation rejects negative max_history."""
-        env_content = "MAX_HISTORY=-10"
-        env_file = create_env_file(env_content)
+    def test_config_set_config(self, set_env, temp_env_file):
+        """Test that set_config updates a single value."""
+        set_env({'MAX_HISTORY': '1000', 'DECIMAL_PLACES': '2'})
+        config = CalculatorConfig(env_file=temp_env_file)
         
-        with pytest.raises(ConfigurationError, match="MAX_HISTORY must be at least 1"):
-            CalculatorConfig(env_file=env_file)
+        config.set_config('MAX_HISTORY', '2000')
+        # Only the cached value is updated; the file is not re-read
+        assert config.get_max_history() == 2000
+        assert config.get_decimal_places() == 2
     
-    def test_config_invalid_decimal_places(self, create_env_file):
-        """Test validation rejects negative decimal_places."""
-        env_content = "DECIMAL_PLACES=-1"
-        env_file = create_env_file(env_content)
+    def test_config_set_config_invalid(self, set_env, temp_env_file):
+        """Test set_config re-validates the updated value."""
+        set_env({'MAX_HISTORY': '1000'})
+        config = CalculatorConfig(env_file=temp_env_file)
         
-        with pytest.raises(ConfigurationError, match="DECIMAL_PLACES must be non-negative"):
-            CalculatorConfig(env_file=env_file)
-    
-    def test_config_set_config(self, create_env_file):
-        """Test that set_config method exists and runs without error."""
-        import os
-        env_content = "MAX_HISTORY=1000\nDECIMAL_PLACES=2"
-        env_file = create_env_file(env_content)
-        config = CalculatorConfig(env_file=env_file)
+        with pytest.raises(ConfigurationError, match=_MAX_HIST_RE):
+            config.set_config('MAX_HISTORY', '0')
         
-        # Just verify set_config runs without error
-        config.set_config('MAX_HISTORY', '2000')
-        # The method sets env var and calls load_config
-        # File values take precedence so config remains at 1000
         assert config.get_max_history() == 1000
     
-    def test_config_validate_config(self, create_env_file):
+    def test_config_validate_config(self, set_env, temp_env_file):
         """Test config validation."""
-        env_content = "MAX_HISTORY=1000\nDECIMAL_PLACES=2"
-        env_file = create_env_file(env_content)
-        config = CalculatorConfig(env_file=env_file)
+        set_env({'MAX_HISTORY': '1000', 'DECIMAL_PLACES': '2'})
+        config = CalculatorConfig(env_file=temp_env_file)
         
         # Should not raise error with valid config
         config.validate_config()
@@ -2,19 +2,26 @@
 Unit tests for history management with pandas.
 """
 
+import os
 import pytest
 import pandas as pd
 from pathlib import Path
 from app.history import CalculationHistory
-from app.calculation import Calculation
+from app.calculation import Calculation, CalculationBatch, CalculationObserver
 from app.operations import AdditionStrategy, MultiplicationStrategy
 from app.exceptions import HistoryError
 
 
+@pytest.fixture(scope="module")
+def csv_dir(tmp_path_factory):
+    """Fixture to provide one temporary directory for the module's CSV files."""
+    return tmp_path_factory.mktemp("history")
+
+
 @pytest.fixture
-def temp_csv_file(tmp_path):
-    """Fixture to provide temporary CSV file path."""
-    return str(tmp_path / "test_history.csv")
+def temp_csv_file(csv_dir, request):
+    """Fixture to provide a temporary CSV file path unique to the test."""
+    return str(csv_dir / f"{request.node.name}.csv")
 
 
 @pytest.fixture
@@ -23,12 +30,25 @@ def history(temp_csv_file):
     return CalculationHistory(csv_file=temp_csv_file)
 
 
+@pytest.fixture
+def make_history_with(history):
+    """Fixture to fill the history with n executed calculations in one batch."""
+    def _make(n):
+        strategy = AdditionStrategy()
+        calcs = [Calculation(i, i + 1, "add", strategy) for i in range(n)]
+        for calc in calcs:
+            calc.execute()
+        history.bulk_add(calcs)
+        return history
+    return _make
+
+
 class TestCalculationHistory:
     """Test suite for CalculationHistory class."""
     
     def test_history_initialization(self, history):
         """Test history initialization."""
-        assert isinstance(history.df, pd.DataFrame)
+        assert type(history.df) is pd.DataFrame
         assert history.is_empty()
     
     def test_add_calculation(self, history):
@@ -52,6 +72,65 @@ class TestCalculationHistory:
         
         assert history.get_count() == 1
     
+    def test_attach_and_detach_observer(self, history):
+        """Test observers are attached once and can be detached."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.attach_observer(history)
+        calc.attach_observer(history)
+        assert calc.get_observers() == [history]
+        
+        calc.detach_observer(history)
+        calc.execute()
+        
+        assert calc.get_observers() == []
+        assert history.get_count() == 0
+    
+    def test_observer_skipped_below_notify_level(self, history):
+        """Test observers with a higher notify_level are not notified."""
+        history.notify_level = 1
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.attach_observer(history)
+        
+        calc.execute()
+        assert history.get_count() == 0
+        
+        calc.notify_observers(level=1)
+        assert history.get_count() == 1
+    
+    def test_batch_update(self, history):
+        """Test batched calculations notify the history once on exit."""
+        strategy = AdditionStrategy()
+        
+        with CalculationBatch() as batch:
+            for i in range(3):
+                calc = Calculation(i, 1, "add", strategy)
+                calc.attach_observer(history)
+                assert batch.execute(calc) == i + 1
+            assert history.get_count() == 0
+        
+        assert history.get_count() == 3
+        assert list(history.get_history()['result']) == [1, 2, 3]
+    
+    def test_batch_default_update_batch(self):
+        """Test the default update_batch falls back to update per calculation."""
+        class RecordingObserver(CalculationObserver):
+            def __init__(self):
+                self.seen = []
+            
+            def update(self, calculation):
+                self.seen.append(calculation)
+        
+        observer = RecordingObserver()
+        calc1 = Calculation(5, 3, "add", AdditionStrategy())
+        calc2 = Calculation(10, 2, "add", AdditionStrategy())
+        
+        with CalculationBatch() as batch:
+            for calc in (calc1, calc2):
+                calc.attach_observer(observer)
+                batch.execute(calc)
+        
+        assert observer.seen == [calc1, calc2]
+    
     def test_get_history(self, history):
         """Test retrieving history as DataFrame."""
         strategy = AdditionStrategy()
@@ -65,21 +144,50 @@ class TestCalculationHistory:
         
         df = history.get_history()
         
-        assert isinstance(df, pd.DataFrame)
+        assert type(df) is pd.DataFrame
         assert len(df) == 2
     
-    def test_get_last_n(self, history):
-        """Test getting last n calculations."""
+    def test_buffered_rows_preserve_order(self, history):
+        """Test buffered calculations are merged in insertion order."""
         strategy = AdditionStrategy()
         
-        for i in range(5):
-            calc = Calculation(i, i+1, "add", strategy)
+        for i in range(3):
+            calc = Calculation(i, 1, "add", strategy)
+            calc.execute()
+            history.add_calculation(calc)
+        
+        df = history.get_history()
+        
+        assert list(df['operand1']) == [0, 1, 2]
+        assert history.get_count() == 3
+    
+    def test_history_grows_past_initial_capacity(self, history):
+        """Test history keeps every row once storage has to grow."""
+        strategy = AdditionStrategy()
+        calcs = []
+        for i in range(150):
+            calc = Calculation(i, 1, "add", strategy)
             calc.execute()
+            calcs.append(calc)
+        
+        history.update_batch(calcs[:100])
+        for calc in calcs[100:]:
             history.add_calculation(calc)
         
+        df = history.get_history()
+        assert history.get_count() == 150
+        assert list(df['operand1']) == list(range(150))
+        assert df['result'].iloc[-1] == 150
+    
+    def test_get_last_n(self, make_history_with):
+        """Test getting last n calculations."""
+        history = make_history_with(5)
+        
         last_3 = history.get_last_n(3)
         
         assert len(last_3) == 3
+        assert list(last_3['operand1']) == [2, 3, 4]
+        assert history.is_dirty() is True
     
     def test_clear_history(self, history):
         """Test clearing history."""
@@ -108,8 +216,129 @@ class TestCalculationHistory:
         
         assert new_history.get_count() == 1
         df = new_history.get_history()
-        assert df.iloc[0]['operand1'] == 5.0
-        assert df.iloc[0]['operand2'] == 3.0
+        assert df.at[0, 'operand1'] == 5.0
+        assert df.at[0, 'operand2'] == 3.0
+    
+    def test_load_history_missing_columns(self, temp_csv_file):
+        """Test loading a CSV without some expected columns."""
+        pd.DataFrame({'operand1': [5.0], 'operand2': [3.0], 'operation': ['add']}).to_csv(
+            temp_csv_file, index=False
+        )
+        
+        history = CalculationHistory(csv_file=temp_csv_file)
+        df = history.get_history()
+        
+        assert history.get_count() == 1
+        assert list(df.columns) == ['operand1', 'operand2', 'operation', 'result', 'timestamp']
+        assert pd.isna(df.at[0, 'result'])
+        assert df.at[0, 'timestamp'] is None
+    
+    def test_load_history_complex_result(self, temp_csv_file):
+        """Test loading a CSV that holds a complex result."""
+        pd.DataFrame({'operand1': [-8.0, 5.0], 'operand2': [3.0, 3.0],
+                      'operation': ['root', 'add'], 'result': ['(1+1.7j)', '8.0'],
+                      'timestamp': [None, None]}).to_csv(temp_csv_file, index=False)
+        
+        history = CalculationHistory(csv_file=temp_csv_file)
+        
+        assert history.get_count() == 2
+        assert history.get_history().at[0, 'result'] == '(1+1.7j)'
+    
+    def test_load_is_deferred_until_access(self, history, temp_csv_file):
+        """Test the CSV is read lazily and merged with rows added before access."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.save_history()
+        
+        new_history = CalculationHistory(csv_file=temp_csv_file)
+        calc2 = Calculation(7, 2, "add", AdditionStrategy())
+        calc2.execute()
+        new_history.add_calculation(calc2)
+        
+        df = new_history.get_history()
+        assert list(df['operand1']) == [5.0, 7.0]
+    
+    def test_failed_deferred_load_keeps_pending_rows(self, history, temp_csv_file, monkeypatch):
+        """Test rows added before first access survive a failed CSV read."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.save_history()
+        
+        new_history = CalculationHistory(csv_file=temp_csv_file)
+        calc2 = Calculation(7, 2, "add", AdditionStrategy())
+        calc2.execute()
+        new_history.add_calculation(calc2)
+        
+        def fail(*args, **kwargs):
+            raise OSError("disk error")
+        
+        monkeypatch.setattr(pd, 'read_csv', fail)
+        with pytest.raises(HistoryError):
+            new_history.get_count()
+        monkeypatch.undo()
+        
+        assert new_history.get_unsaved_count() == 1
+        assert list(new_history.get_history()['operand1']) == [5.0, 7.0]
+    
+    def test_dirty_tracking(self, history):
+        """Test unsaved calculations are tracked until saved."""
+        assert history.is_dirty() is False
+        
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.add_calculation(calc)
+        
+        assert history.get_unsaved_count() == 2
+        history.save_history()
+        assert history.is_dirty() is False
+        assert history.get_unsaved_count() == 0
+    
+    def test_load_skipped_when_file_unchanged(self, history, monkeypatch):
+        """Test reloading an unchanged file does not parse it again."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.save_history()
+        
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be re-read")
+        
+        monkeypatch.setattr(pd, 'read_csv', fail_read_csv)
+        monkeypatch.setattr('app.history._LOAD_CHECK_TTL', 0.0)
+        history.load_history()
+        
+        assert history.get_count() == 1
+    
+    def test_load_rereads_modified_file(self, history, temp_csv_file, monkeypatch):
+        """Test reloading picks up a file changed since the last save."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.save_history()
+        
+        pd.DataFrame({'operand1': [1.0, 2.0], 'operand2': [1.0, 2.0],
+                      'operation': ['add', 'add']}).to_csv(temp_csv_file, index=False)
+        stat_result = os.stat(temp_csv_file)
+        os.utime(temp_csv_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        monkeypatch.setattr('app.history._LOAD_CHECK_TTL', 0.0)
+        history.load_history()
+        
+        assert history.get_count() == 2
+    
+    def test_load_after_clear_rereads_file(self, history):
+        """Test clearing history forces the next load to read the file."""
+        calc = Calculation(5, 3, "add", AdditionStrategy())
+        calc.execute()
+        history.add_calculation(calc)
+        history.save_history()
+        
+        history.clear_history()
+        history.load_history()
+        
+        assert history.get_count() == 1
     
     def test_get_statistics(self, history):
         """Test getting history statistics."""
@@ -3,6 +3,7 @@ Unit tests for operations module with Strategy Pattern.
 """
 
 import pytest
+import re
 from app.operations import (
     OperationStrategy,
     AdditionStrategy,
@@ -17,117 +18,120 @@ from app.operations import (
 from app.exceptions import InvalidOperationError, DivisionByZeroError
 
 
+DIV_ZERO = re.compile("Cannot divide by zero")
+ROOT_ZERO = re.compile("Cannot calculate 0th root")
+MOD_ZERO = re.compile("Cannot perform modulus by zero")
+UNSUPPORTED = re.compile("Unsupported operation")
+
+_create = OperationFactory.create_operation
+_ops = OperationFactory.get_available_operations
+
+CASES = [
+    pytest.param(AdditionStrategy, 5, 3, 8, id="add-5-3"),
+    pytest.param(AdditionStrategy, -5, 3, -2, id="add--5-3"),
+    pytest.param(AdditionStrategy, 0, 0, 0, id="add-0-0"),
+    pytest.param(SubtractionStrategy, 5, 3, 2, id="subtract-5-3"),
+    pytest.param(SubtractionStrategy, -5, 3, -8, id="subtract--5-3"),
+    pytest.param(SubtractionStrategy, 0, 0, 0, id="subtract-0-0"),
+    pytest.param(MultiplicationStrategy, 5, 3, 15, id="multiply-5-3"),
+    pytest.param(MultiplicationStrategy, -5, 3, -15, id="multiply--5-3"),
+    pytest.param(MultiplicationStrategy, 0, 5, 0, id="multiply-0-5"),
+    pytest.param(DivisionStrategy, 10, 2, 5, id="divide-10-2"),
+    pytest.param(DivisionStrategy, -10, 2, -5, id="divide--10-2"),
+    pytest.param(DivisionStrategy, 0, 5, 0, id="divide-0-5"),
+    pytest.param(PowerStrategy, 2, 3, 8, id="power-2-3"),
+    pytest.param(PowerStrategy, 5, 2, 25, id="power-5-2"),
+    pytest.param(PowerStrategy, 10, 0, 1, id="power-10-0"),
+    pytest.param(RootStrategy, 16, 2, 4, id="root-16-2"),
+    pytest.param(RootStrategy, 27, 3, 3, id="root-27-3"),
+    pytest.param(RootStrategy, 100, 2, 10, id="root-100-2"),
+    pytest.param(ModulusStrategy, 10, 3, 1, id="modulus-10-3"),
+    pytest.param(ModulusStrategy, 20, 6, 2, id="modulus-20-6"),
+    pytest.param(ModulusStrategy, 15, 4, 3, id="modulus-15-4"),
+]
+
+ERROR_CASES = [
+    pytest.param(DivisionStrategy, 10, 0, DIV_ZERO, id="divide-by-zero"),
+    pytest.param(RootStrategy, 10, 0, ROOT_ZERO, id="root-by-zero"),
+    pytest.param(ModulusStrategy, 10, 0, MOD_ZERO, id="modulus-by-zero"),
+]
+
+
 class TestOperationStrategies:
     """Test suite for operation strategy classes."""
     
-    def test_addition_strategy(self):
-        """Test addition strategy."""
-        strategy = AdditionStrategy()
-        assert strategy.execute(5, 3) == 8
-        assert strategy.execute(-5, 3) == -2
-        assert strategy.execute(0, 0) == 0
-    
-    def test_subtraction_strategy(self):
-        """Test subtraction strategy."""
-        strategy = SubtractionStrategy()
-        assert strategy.execute(5, 3) == 2
-        assert strategy.execute(-5, 3) == -8
-        assert strategy.execute(0, 0) == 0
-    
-    def test_multiplication_strategy(self):
-        """Test multiplication strategy."""
-        strategy = MultiplicationStrategy()
-        assert strategy.execute(5, 3) == 15
-        assert strategy.execute(-5, 3) == -15
-        assert strategy.execute(0, 5) == 0
-    
-    def test_division_strategy(self):
-        """Test division strategy."""
-        strategy = DivisionStrategy()
-        assert strategy.execute(10, 2) == 5
-        assert strategy.execute(-10, 2) == -5
-        assert strategy.execute(0, 5) == 0
-    
-    def test_division_by_zero(self):
-        """Test division by zero raises error."""
-        strategy = DivisionStrategy()
-        with pytest.raises(DivisionByZeroError, match="Cannot divide by zero"):
-            strategy.execute(10, 0)
-    
-    def test_power_strategy(self):
-        """Test power strategy."""
-        strategy = PowerStrategy()
-        assert strategy.execute(2, 3) == 8
-        assert strategy.execute(5, 2) == 25
-        assert strategy.execute(10, 0) == 1
+    @pytest.mark.parametrize("cls,a,b,expected", CASES)
+    def test_execute(self, strategies, cls, a, b, expected):
+        """Test each strategy computes the expected result."""
+        assert strategies[cls].execute(a, b) == expected
     
-    def test_root_strategy(self):
-        """Test root strategy."""
-        strategy = RootStrategy()
-        assert strategy.execute(16, 2) == 4
-        assert strategy.execute(27, 3) == 3
-        assert strategy.execute(100, 2) == 10
-    
-    def test_root_by_zero(self):
-        """Test root by zero raises error."""
-        strategy = RootStrategy()
-        with pytest.raises(DivisionByZeroError, match="Cannot calculate 0th root"):
-            strategy.execute(10, 0)
-    
-    def test_modulus_strategy(self):
-        """Test modulus strategy."""
-        strategy = ModulusStrategy()
-        assert strategy.execute(10, 3) == 1
-        assert strategy.execute(20, 6) == 2
-        assert strategy.execute(15, 4) == 3
-    
-    def test_modulus_by_zero(self):
-        """Test modulus by zero raises error."""
-        strategy = ModulusStrategy()
-        with pytest.raises(DivisionByZeroError, match="Cannot perform modulus by zero"):
-            strategy.execute(10, 0)
+    @pytest.mark.parametrize("cls,a,b,exc_match", ERROR_CASES)
+    def test_execute_by_zero(self, strategies, cls, a, b, exc_match):
+        """Test strategies reject a zero second operand where undefined."""
+        with pytest.raises(DivisionByZeroError, match=exc_match):
+            strategies[cls].execute(a, b)
 
 
 class TestOperationFactory:
     """Test suite for operation factory."""
     
+    @pytest.fixture(scope="class")
+    @classmethod
+    def available_ops(cls):
+        """Fixture to provide the available operation names once per class."""
+        return frozenset(_ops())
+    
     @pytest.mark.parametrize("operation_name,strategy_class", [
-        ('add', AdditionStrategy),
-        ('subtract', SubtractionStrategy),
-        ('multiply', MultiplicationStrategy),
-        ('divide', DivisionStrategy),
-        ('power', PowerStrategy),
-        ('root', RootStrategy),
-        ('modulus', ModulusStrategy),
+        pytest.param("add", AdditionStrategy, id="add"),
+        pytest.param("subtract", SubtractionStrategy, id="subtract"),
+        pytest.param("multiply", MultiplicationStrategy, id="multiply"),
+        pytest.param("divide", DivisionStrategy, id="divide"),
+        pytest.param("power", PowerStrategy, id="power"),
+        pytest.param("root", RootStrategy, id="root"),
+        pytest.param("modulus", ModulusStrategy, id="modulus"),
     ])
     def test_factory_creates_correct_strategy(self, operation_name, strategy_class):
         """Test factory creates correct strategy for each operation."""
-        strategy = OperationFactory.create_operation(operation_name)
+        strategy = _create(operation_name)
         assert isinstance(strategy, strategy_class)
     
-    def test_factory_case_insensitive(self):
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param('add', AdditionStrategy, id="lower"),
+        pytest.param('ADD', AdditionStrategy, id="upper"),
+        pytest.param('AdD', AdditionStrategy, id="mixed"),
+    ])
+    def test_factory_case_insensitive(self, raw, expected):
         """Test factory handles case-insensitive operation names."""
-        strategy_lower = OperationFactory.create_operation('add')
-        strategy_upper = OperationFactory.create_operation('ADD')
-        strategy_mixed = OperationFactory.create_operation('AdD')
+        assert isinstance(_create(raw), expected)
+    
+    def test_factory_reuses_strategy_instance(self):
+        """Test factory returns the same stateless strategy instance."""
+        assert _create('add') is _create('ADD')
+    
+    def test_normalize_operation_name(self):
+        """Test operation names are lowercased and interned."""
+        name = OperationFactory.normalize_operation_name(''.join(['A', 'dd']))
         
-        assert isinstance(strategy_lower, AdditionStrategy)
-        assert isinstance(strategy_upper, AdditionStrategy)
-        assert isinstance(strategy_mixed, AdditionStrategy)
+        assert name == 'add'
+        assert name is OperationFactory.normalize_operation_name('ADD')
     
     def test_factory_invalid_operation(self):
         """Test factory raises error for invalid operation."""
-        with pytest.raises(InvalidOperationError, match="Unsupported operation"):
-            OperationFactory.create_operation('invalid')
+        with pytest.raises(InvalidOperationError, match=UNSUPPORTED):
+            _create('invalid')
+    
+    def test_factory_invalid_operation_keeps_given_name(self):
+        """Test the error message shows the operation name as given."""
+        with pytest.raises(InvalidOperationError, match="'INVALID'"):
+            _create('INVALID')
+    
+    def test_factory_invalid_operation_lists_available(self):
+        """Test error message lists every available operation."""
+        with pytest.raises(InvalidOperationError, match="Available: add, subtract, multiply, divide, power, root, modulus"):
+            _create('invalid')
     
-    def test_get_available_operations(self):
+    def test_get_available_operations(self, available_ops):
         """Test getting list of available operations."""
-        operations = OperationFactory.get_available_operations()
-        assert 'add' in operations
-        assert 'subtract' in operations
-        assert 'multiply' in operations
-        assert 'divide' in operations
-        assert 'power' in operations
-        assert 'root' in operations
-        assert 'modulus' in operations
-        assert len(operations) == 7
\ No newline at end of file
+        assert available_ops == frozenset(
+            {'add', 'subtract', 'multiply', 'divide', 'power', 'root', 'modulus'}
+        )
\ No newline at end of file
@@ -3,101 +3,86 @@ Unit tests for input validation.
 """
 
 import pytest
-from app.input_validators import InputValidator
+import re
 from app.exceptions import InvalidInputError
 
 
+EMPTY = re.compile("Input cannot be empty")
+BAD_FMT = re.compile("Invalid input format")
+BAD_NUM = re.compile("Invalid numbers")
+
+
 class TestInputValidator:
     """Test suite for InputValidator class."""
     
-    def test_validate_operation_input_valid(self):
+    def test_validate_operation_input_valid(self, validator):
         """Test validation of valid operation input."""
-        validator = InputValidator()
         operation, num1, num2 = validator.validate_operation_input("add 5 3")
         
         assert operation == "add"
         assert num1 == 5.0
         assert num2 == 3.0
     
-    def test_validate_operation_input_with_floats(self):
+    def test_validate_operation_input_with_floats(self, validator):
         """Test validation with float numbers."""
-        validator = InputValidator()
         operation, num1, num2 = validator.validate_operation_input("multiply 2.5 3.7")
         
         assert operation == "multiply"
         assert num1 == 2.5
         assert num2 == 3.7
     
-    def test_validate_operation_input_with_negatives(self):
+    def test_validate_operation_input_with_negatives(self, validator):
         """Test validation with negative numbers."""
-        validator = InputValidator()
         operation, num1, num2 = validator.validate_operation_input("subtract -5 -3")
         
         assert operation == "subtract"
         assert num1 == -5.0
         assert num2 == -3.0
     
-    def test_validate_operation_input_empty(self):
-        """Test validation rejects empty input."""
-        validator = InputValidator()
-        
-        with pytest.raises(InvalidInputError, match="Input cannot be empty"):
-            validator.validate_operation_input("")
-    
-    def test_validate_operation_input_whitespace_only(self):
-        """Test validation rejects whitespace-only input."""
-        validator = InputValidator()
+    def test_validate_operation_input_with_exponents(self, validator):
+        """Test validation with scientific notation and extra whitespace."""
+        operation, num1, num2 = validator.validate_operation_input("  power 1.5e2   -.5 ")
         
-        with pytest.raises(InvalidInputError, match="Input cannot be empty"):
-            validator.validate_operation_input("   ")
+        assert operation == "power"
+        assert num1 == 150.0
+        assert num2 == -0.5
     
-    def test_validate_operation_input_too_few_parts(self):
-        """Test validation rejects input with too few parts."""
-        validator = InputValidator()
+    def test_validate_operation_input_special_floats(self, validator):
+        """Test validation still accepts any value float() understands."""
+        operation, num1, num2 = validator.validate_operation_input("add inf 1_000")
         
-        with pytest.raises(InvalidInputError, match="Invalid input format"):
-            validator.validate_operation_input("add 5")
-    
-    def test_validate_operation_input_too_many_parts(self):
-        """Test validation rejects input with too many parts."""
-        validator = InputValidator()
-        
-        with pytest.raises(InvalidInputError, match="Invalid input format"):
-            validator.validate_operation_input("add 5 3 2")
-    
-    def test_validate_operation_input_invalid_numbers(self):
-        """Test validation rejects non-numeric operands."""
-        validator = InputValidator()
-        
-        with pytest.raises(InvalidInputError, match="Invalid numbers"):
-            validator.validate_operation_input("add five three")
+        assert operation == "add"
+        assert num1 == float("inf")
+        assert num2 == 1000.0
     
-    def test_validate_operation_input_one_invalid_number(self):
-        """Test validation rejects when one operand is non-numeric."""
-        validator = InputValidator()
-        
-        with pytest.raises(InvalidInputError, match="Invalid numbers"):
-            validator.validate_operation_input("add 5 three")
+    @pytest.mark.parametrize("raw,match", [
+        pytest.param("", EMPTY, id="empty"),
+        pytest.param("   ", EMPTY, id="whitespace-only"),
+        pytest.param("add 5", BAD_FMT, id="too-few-parts"),
+        pytest.param("add 5 3 2", BAD_FMT, id="too-many-parts"),
+        pytest.param("add five three", BAD_NUM, id="invalid-numbers"),
+        pytest.param("add 5 three", BAD_NUM, id="one-invalid-number"),
+    ])
+    def test_validate_operation_input_errors(self, validator, raw, match):
+        """Test validation rejects malformed operation input."""
+        with pytest.raises(InvalidInputError, match=match):
+            validator.validate_operation_input(raw)
     
-    def test_validate_command_valid(self):
-        """Test validation of valid commands."""
-        validator = InputValidator()
-        
-        assert validator.validate_command("help") == "help"
-        assert validator.validate_command("HELP") == "help"
-        assert validator.validate_command("  help  ") == "help"
+    @pytest.mark.parametrize("raw,expected", [
+        pytest.param("help", "help", id="lower"),
+        pytest.param("HELP", "help", id="upper"),
+        pytest.param("  help  ", "help", id="padded"),
+        pytest.param("EXIT", "exit", id="exit-upper"),
+        pytest.param("History", "history", id="history-title"),
+        pytest.param("CLEAR", "clear", id="clear-upper"),
+    ])
+    def test_validate_command(self, validator, raw, expected):
+        """Test commands are trimmed and matched case-insensitively."""
+        assert validator.validate_command(raw) == expected
     
-    def test_validate_command_empty(self):
+    def test_validate_command_empty(self, validator):
         """Test validation of empty command."""
-        validator = InputValidator()
-        
-        assert validator.validate_command("") == ""
-        assert validator.validate_command("   ") == ""
-    
-    def test_validate_command_case_insensitive(self):
-        """Test command validation is case insensitive."""
-        validator = InputValidator()
+        validate = validator.validate_command
         
-        assert validator.validate_command("EXIT") == "exit"
-        assert validator.validate_command("History") == "history"
-        assert validator.validate_command("CLEAR") == "clear"
\ No newline at end of file
+        assert validate("") == ""
+        assert validate("   ") == ""